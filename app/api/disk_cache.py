@@ -0,0 +1,111 @@
+"""
+Disk-backed JSON cache for extraction results
+
+Each caller owns a cache directory and TTL and passes them explicitly, so
+separate caches (Gemini results, OCR text) never share defaults.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def make_key(*fields: str) -> str:
+    """Build a cache key from the SHA-256 of length-prefixed fields"""
+    digest = hashlib.sha256()
+    for field in fields:
+        encoded = field.encode("utf-8")
+        digest.update(f"{len(encoded)}:".encode("ascii"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+def _entry_path(key: str, cache_dir: str) -> str:
+    return os.path.join(cache_dir, f"{key}.json")
+
+
+def get(key: str, cache_dir: str) -> Optional[Dict[str, Any]]:
+    """Return the cached value for key, or None if missing or expired"""
+    path = _entry_path(key, cache_dir)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+        _remove(path)
+        return None
+    if not isinstance(entry, dict):
+        logger.warning(f"Discarding malformed cache entry {path}")
+        _remove(path)
+        return None
+
+    expires_at = entry.get("expiresAt")
+    if expires_at is not None and expires_at < time.time():
+        logger.debug(f"Cache entry expired: {key}")
+        _remove(path)
+        return None
+
+    return entry.get("value")
+
+
+def set(
+    key: str,
+    value: Dict[str, Any],
+    cache_dir: str,
+    ttl_seconds: int,
+) -> None:
+    """Store value under key, replacing any existing entry atomically
+
+    A ttl_seconds of 0 keeps the entry until it is deleted by hand.
+    """
+    created_at = time.time()
+    entry = {
+        "createdAt": created_at,
+        "expiresAt": created_at + ttl_seconds if ttl_seconds > 0 else None,
+        "value": value,
+    }
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, _entry_path(key, cache_dir))
+    except OSError as e:
+        logger.warning(f"Failed to write cache entry {key}: {e}")
+
+
+def prune(cache_dir: str) -> int:
+    """Delete expired entries from cache_dir and return how many were removed"""
+    removed = 0
+    now = time.time()
+    try:
+        entries = [e for e in os.scandir(cache_dir) if e.name.endswith(".json")]
+    except FileNotFoundError:
+        return 0
+
+    for dir_entry in entries:
+        try:
+            with open(dir_entry.path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            expires_at = entry.get("expiresAt") if isinstance(entry, dict) else 0
+        except (OSError, ValueError):
+            expires_at = 0
+        if expires_at is not None and expires_at < now:
+            _remove(dir_entry.path)
+            removed += 1
+    return removed
+
+
+def _remove(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
@@ -5,19 +5,29 @@ Exposes PDF form extraction as a REST API
 
 from fastapi import FastAPI, File, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 import os
 import json
 import tempfile
 import asyncio
-from typing import Dict, Any, Optional
+import hashlib
+import multiprocessing
+import threading
+from contextlib import asynccontextmanager
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Any, List, Optional, TypeVar, Union
 import uvicorn
 import logging
+import re
+
+import aiofiles
+import httpx
 
-from pdf2image import convert_from_path
-import pytesseract
 from google import genai
-import re
+from google.genai import types
 
 try:
     from .exceptions import (
@@ -29,6 +39,16 @@ try:
         ValidationError,
     )
     from .error_handlers import register_error_handlers
+    from . import disk_cache
+    from .ocr import (
+        OCR_BINARIZE,
+        OCR_DPI,
+        OCR_MAX_PAGE_PIXELS,
+        count_pages,
+        init_worker,
+        ocr_page,
+        read_text_layer,
+    )
 except ImportError:
     # Fallback for running as a script
     from app.api.exceptions import (
@@ -40,6 +60,16 @@ except ImportError:
         ValidationError,
     )
     from error_handlers import register_error_handlers
+    from app.api import disk_cache
+    from app.api.ocr import (
+        OCR_BINARIZE,
+        OCR_DPI,
+        OCR_MAX_PAGE_PIXELS,
+        count_pages,
+        init_worker,
+        ocr_page,
+        read_text_layer,
+    )
 
 # Configure logging
 logging.basicConfig(
@@ -49,8 +79,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the Gemini client and OCR pool inside each server worker"""
+    global client, OCR_POOL
+    client = genai.Client(
+        api_key=GEMINI_API_KEY,
+        http_options=types.HttpOptions(
+            async_client_args={"limits": GEMINI_HTTP_LIMITS},
+        ),
+    )
+    OCR_POOL = _create_ocr_pool()
+    logger.info(f"Started OCR pool with {OCR_WORKERS} workers")
+    for cache_dir in (LLM_CACHE_DIR, OCR_CACHE_DIR):
+        removed = await asyncio.to_thread(disk_cache.prune, cache_dir)
+        logger.info(f"Pruned {removed} expired cache entries from {cache_dir}")
+    try:
+        yield
+    finally:
+        OCR_POOL.shutdown(wait=False, cancel_futures=True)
+
+
 # Initialize FastAPI app
-app = FastAPI(title="PDF OCR and Gemini LLM Service")
+app = FastAPI(
+    title="PDF OCR and Gemini LLM Service",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 # Register error handlers
 register_error_handlers(app)
@@ -76,7 +131,92 @@ GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
 if not GEMINI_API_KEY:
     raise ValueError("GEMINI_API_KEY environment variable is required")
 
-client = genai.Client(api_key=GEMINI_API_KEY)
+# Created per server worker in lifespan(), after uvicorn has forked
+client: Optional[genai.Client] = None
+GEMINI_MODEL = "gemini-2.5-flash"
+GEMINI_TIMEOUT_SECONDS = 60
+GEMINI_MAX_RETRIES = 2
+
+# Keep-alive pool for the async Gemini client, sized to expected concurrency
+# so concurrent requests reuse TLS connections instead of re-handshaking
+GEMINI_MAX_CONNECTIONS = int(os.environ.get("GEMINI_MAX_CONNECTIONS", "100"))
+GEMINI_HTTP_LIMITS = httpx.Limits(
+    max_connections=GEMINI_MAX_CONNECTIONS,
+    max_keepalive_connections=GEMINI_MAX_CONNECTIONS,
+)
+
+# Input budget for prompt + OCR text, estimated at ~4 chars per token
+GEMINI_MAX_INPUT_TOKENS = int(os.environ.get("GEMINI_MAX_INPUT_TOKENS", "30000"))
+CHARS_PER_TOKEN = 4
+
+# Ask for JSON output natively; the form layout is unknown, so no fixed schema
+GEMINI_CONFIG = types.GenerateContentConfig(response_mime_type="application/json")
+
+# Finish reasons that recur for the same input, so a retry cannot succeed
+GEMINI_BLOCKING_FINISH_REASONS = {
+    types.FinishReason.SAFETY,
+    types.FinishReason.RECITATION,
+    types.FinishReason.BLOCKLIST,
+    types.FinishReason.PROHIBITED_CONTENT,
+    types.FinishReason.SPII,
+}
+
+# Bump when the default prompt or config changes so cached extractions are not reused
+PROMPT_VERSION = "v4"
+
+def _available_cpus() -> int:
+    """Count the CPUs this process may use, honouring a cgroup v2 CPU quota"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, int(quota) // int(period)))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+# Number of uvicorn worker processes sharing this machine's cores
+WEB_CONCURRENCY = int(os.environ.get("WEB_CONCURRENCY", "1"))
+
+# Process pool for per-page OCR, created once per server worker so requests
+# don't pay the fork cost. Parallelism comes from this pool rather than from
+# many web workers, so the (quota-aware) cores are split across web workers.
+OCR_WORKERS = int(
+    os.environ.get("OCR_WORKERS", max(1, _available_cpus() // WEB_CONCURRENCY))
+)
+OCR_POOL: Optional[ProcessPoolExecutor] = None
+_OCR_POOL_LOCK = threading.Lock()
+
+T = TypeVar("T")
+
+# On-disk caches hold extracted form data (possibly PII) in plaintext, so
+# entries expire after a day by default; a TTL of 0 keeps them forever.
+# Gemini results are keyed by prompt + page text, OCR text by PDF hash.
+LLM_CACHE_DIR = os.environ.get("LLM_CACHE_DIR", ".llm_cache")
+LLM_CACHE_TTL_SECONDS = int(os.environ.get("LLM_CACHE_TTL_SECONDS", str(24 * 60 * 60)))
+OCR_CACHE_DIR = os.environ.get("OCR_CACHE_DIR", ".ocr_cache")
+OCR_CACHE_TTL_SECONDS = int(os.environ.get("OCR_CACHE_TTL_SECONDS", str(24 * 60 * 60)))
+
+# Bump when Tesseract settings, rendering, binarization or the text-layer
+# threshold change so cached page text is not reused
+OCR_VERSION = "v1"
+
+# Pages with less embedded text than this are treated as scanned and OCRed
+TEXT_LAYER_MIN_CHARS_PER_PAGE = 50
+
+# Collapses any run of whitespace in OCR output to a single space
+_WS_RE = re.compile(r"\s+")
+
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB
+
+# Upper bound on PDFs accepted by a single /extract-pdfs request
+MAX_BATCH_FILES = int(os.environ.get("MAX_BATCH_FILES", "10"))
 
 # Response Models
 class LLMResponse(BaseModel):
@@ -86,23 +226,152 @@ class LLMResponse(BaseModel):
 
 
 # Helper Functions
+def _create_ocr_pool() -> ProcessPoolExecutor:
+    """Start a new OCR process pool"""
+    # forkserver: forking lazily from a busy, multi-threaded parent could copy
+    # locks held by other threads (logging, PDFium) into a child and deadlock
+    return ProcessPoolExecutor(
+        max_workers=OCR_WORKERS,
+        initializer=init_worker,
+        mp_context=multiprocessing.get_context("forkserver"),
+    )
+
+
+def _with_ocr_pool(task: Callable[[ProcessPoolExecutor], T]) -> T:
+    """Run task against the OCR pool, replacing the pool if a worker died"""
+    global OCR_POOL
+    pool = OCR_POOL
+    try:
+        return task(pool)
+    except BrokenProcessPool:
+        # A crashed or OOM-killed worker breaks the whole pool; only the
+        # current request fails, later ones get a fresh pool
+        with _OCR_POOL_LOCK:
+            if OCR_POOL is pool:
+                logger.error("OCR worker died; replacing the OCR pool")
+                pool.shutdown(wait=False, cancel_futures=True)
+                OCR_POOL = _create_ocr_pool()
+        raise
+
+
+def _blocked_reason(response: types.GenerateContentResponse) -> Optional[str]:
+    """Return why Gemini refused to answer, or None if the reply was not blocked"""
+    feedback = response.prompt_feedback
+    if feedback and feedback.block_reason:
+        return f"prompt blocked ({feedback.block_reason.name})"
+    if response.candidates:
+        finish_reason = response.candidates[0].finish_reason
+        if finish_reason in GEMINI_BLOCKING_FINISH_REASONS:
+            return f"response blocked ({finish_reason.name})"
+    return None
+
+
 def clean_text(text: str) -> str:
     """Clean and normalize extracted text"""
+    return _WS_RE.sub(" ", text).strip() if text else ""
+
+
+def truncate_to_token_budget(pages: List[str], prompt: str) -> List[str]:
+    """Drop trailing text so prompt and pages together fit the Gemini input token budget"""
+    budget_tokens = GEMINI_MAX_INPUT_TOKENS - len(prompt) // CHARS_PER_TOKEN
+    budget_chars = max(budget_tokens, 0) * CHARS_PER_TOKEN
+    total_chars = sum(len(page) for page in pages)
+    if total_chars <= budget_chars:
+        return pages
+
+    logger.warning(
+        f"Truncating text from {total_chars} to {budget_chars} chars to fit token budget"
+    )
+    kept = []
+    for page in pages:
+        if len(page) > budget_chars:
+            # Cut at a word boundary so the last field value isn't split mid-word
+            head, sep, _ = page[:budget_chars].rpartition(" ")
+            page = head if sep else page[:budget_chars]
+            if page:
+                kept.append(page)
+            break
+        kept.append(page)
+        budget_chars -= len(page)
+    return kept
+
+
+def _parse_int(literal: str) -> Union[int, str]:
+    """Parse a JSON integer, keeping values orjson can't encode as strings"""
+    value = int(literal)
+    # orjson only serializes ints in the signed/unsigned 64-bit range; long
+    # account or reference numbers beyond that are kept verbatim as strings
+    return value if -(1 << 63) <= value < (1 << 64) else literal
+
+
+def parse_json_object(response_text: str) -> Dict[str, Any]:
+    """Parse a JSON object from model output, tolerating text around it"""
     try:
-        if not text:
-            return ""
-        return " ".join(text.split())
-    except Exception as e:
-        logger.error(f"Error in clean_text: {type(e).__name__}: {e}")
-        raise PDFProcessingError(
-            code=ErrorCode.PROCESSING_FAILED,
-            message="Failed to clean extracted text",
-            details={"error": str(e)},
+        parsed = json.loads(response_text, parse_int=_parse_int)
+    except json.JSONDecodeError:
+        # Slice from the first "{" to the last "}" to drop fences or stray prose
+        start = response_text.find("{")
+        end = response_text.rfind("}")
+        if start == -1 or end < start:
+            raise
+        parsed = json.loads(response_text[start : end + 1], parse_int=_parse_int)
+
+    if not isinstance(parsed, dict):
+        raise ValueError("Expected a JSON object at the top level")
+    return parsed
+
+
+def extract_text_fast(pdf_path: str) -> Optional[List[str]]:
+    """Read the embedded text layer per page, or None if the PDF needs OCR"""
+    try:
+        raw_pages = _with_ocr_pool(
+            lambda pool: pool.submit(read_text_layer, pdf_path).result()
+        )
+    except BrokenProcessPool:
+        raise OCRError(
+            code=ErrorCode.OCR_EXTRACTION_FAILED,
+            message="OCR worker crashed while reading the PDF",
+            details={"path": pdf_path},
         )
+    except Exception as e:
+        logger.warning(f"Could not read text layer from {pdf_path}: {e}")
+        return None
+
+    pages = [clean_text(page) for page in raw_pages]
+
+    # Require text on every page so a partly scanned PDF still gets OCRed
+    if not pages or any(len(page) < TEXT_LAYER_MIN_CHARS_PER_PAGE for page in pages):
+        return None
+    return pages
+
+
+def extract_text_from_pdf(pdf_path: str, pdf_sha256: str) -> List[str]:
+    """Extract per-page text, skipping OCR when the PDF has a usable text layer"""
+    # OCR settings are part of the key so changing them invalidates old text
+    cache_key = disk_cache.make_key(
+        OCR_VERSION,
+        pdf_sha256,
+        str(OCR_DPI),
+        str(OCR_BINARIZE),
+        str(OCR_MAX_PAGE_PIXELS),
+    )
+    cached = disk_cache.get(cache_key, OCR_CACHE_DIR)
+    if cached is not None and "pages" in cached:
+        logger.info(f"Returning cached text for PDF {pdf_sha256[:12]}")
+        return cached["pages"]
 
+    pages = extract_text_fast(pdf_path)
+    if pages is not None:
+        logger.info(f"Using embedded text layer for {len(pages)} pages, skipping OCR")
+    else:
+        pages = extract_text_from_pdf_ocr(pdf_path)
 
-def extract_text_from_pdf_ocr(pdf_path: str) -> str:
-    """Extract text from PDF using OCR"""
+    disk_cache.set(cache_key, {"pages": pages}, OCR_CACHE_DIR, OCR_CACHE_TTL_SECONDS)
+    return pages
+
+
+def extract_text_from_pdf_ocr(pdf_path: str) -> List[str]:
+    """Extract cleaned text from each PDF page using OCR, one entry per page"""
     try:
         logger.info(f"Converting text from PDF: {pdf_path}")
 
@@ -113,29 +382,33 @@ def extract_text_from_pdf_ocr(pdf_path: str) -> str:
                 details={"path": pdf_path},
             )
 
-        images = convert_from_path(pdf_path, dpi=300)
+        page_count = _with_ocr_pool(
+            lambda pool: pool.submit(count_pages, pdf_path).result()
+        )
 
-        if not images:
+        if not page_count:
             raise OCRError(
                 code=ErrorCode.OCR_EXTRACTION_FAILED,
-                message="Failed to convert PDF to images",
+                message="PDF has no pages to OCR",
                 details={"path": pdf_path},
             )
 
-        ocr_text = ""
-        for img in images:
-            ocr_text += pytesseract.image_to_string(img) + "\n"
-
-        cleaned_text = clean_text(ocr_text)
+        # Workers render and OCR their own page, so no image crosses processes
+        page_texts = _with_ocr_pool(
+            lambda pool: list(pool.map(ocr_page, repeat(pdf_path), range(page_count)))
+        )
+        # Blank pages stay as "" so list positions match PDF page numbers
+        pages = [clean_text(page) for page in page_texts]
 
-        if not cleaned_text or len(cleaned_text.strip()) < 10:
+        extracted_length = sum(len(page) for page in pages)
+        if extracted_length < 10:
             raise OCRError(
                 code=ErrorCode.NO_TEXT_EXTRACTED,
                 message="No meaningful text could be extracted from the PDF",
-                details={"extracted_length": len(cleaned_text)},
+                details={"extracted_length": extracted_length},
             )
 
-        return cleaned_text
+        return pages
 
     except Exception as e:
         logger.error(
@@ -149,10 +422,10 @@ def extract_text_from_pdf_ocr(pdf_path: str) -> str:
         )
 
 
-def extract_structured_data_with_gemini(
-    text: str, custom_prompt: Optional[str] = None
+async def extract_structured_data_with_gemini(
+    pages: List[str], custom_prompt: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Extract structured data from text using Gemini AI"""
+    """Extract structured data from per-page text using Gemini AI"""
     logger.info("Sending text to Gemini for structured extraction...")
 
     default_prompt = """You are a PDF form data extraction assistant. Analyze the provided text from a scanned form and extract all relevant fields and their values into a structured JSON object with the actual data values.
@@ -189,47 +462,117 @@ Example format for extracted data (NOT a schema):
   }
 }
 
-Now extract the actual field values from this text:
+Now extract the actual field values from the pages that follow:
 
 """
 
-    prompt = custom_prompt if custom_prompt else default_prompt
-    full_prompt = f"{prompt}\n\n{text[:15000]}"
+    if not any(pages):
+        raise AIExtractionError(
+            code=ErrorCode.NO_TEXT_EXTRACTED,
+            message="No text available for AI extraction",
+            details={"page_count": len(pages)},
+        )
 
-    logger.info(f"Sending prompt to Gemini (text length: {len(text[:15000])} chars)")
+    prompt = custom_prompt if custom_prompt else default_prompt
+    pages = truncate_to_token_budget(pages, prompt)
+
+    cache_key = disk_cache.make_key(PROMPT_VERSION, GEMINI_MODEL, prompt, *pages)
+    # Cache file I/O runs in a thread so it never blocks the event loop
+    cached = await asyncio.to_thread(disk_cache.get, cache_key, LLM_CACHE_DIR)
+    if cached is not None:
+        logger.info("Returning cached Gemini extraction")
+        return cached
+
+    # Send each page as its own part so the model sees the page structure;
+    # blank pages are skipped but keep their number so labels match the PDF
+    prompt_parts = [
+        types.Part.from_text(text=prompt),
+        *[
+            types.Part.from_text(text=f"--- PAGE {number} ---\n{page}")
+            for number, page in enumerate(pages, start=1)
+            if page
+        ],
+    ]
+
+    logger.info(
+        f"Sending prompt to Gemini ({len(pages)} pages, "
+        f"text length: {sum(len(page) for page in pages)} chars)"
+    )
 
     try:
-        logger.debug("Calling Gemini API...")
-        response = client.models.generate_content(
-            model="gemini-2.5-flash", contents=full_prompt
-        )
-        logger.info("Received response from Gemini")
+        contents = [types.Content(role="user", parts=prompt_parts)]
+        for attempt in range(GEMINI_MAX_RETRIES + 1):
+            logger.debug("Calling Gemini API...")
+            response = await asyncio.wait_for(
+                client.aio.models.generate_content(
+                    model=GEMINI_MODEL, contents=contents, config=GEMINI_CONFIG
+                ),
+                timeout=GEMINI_TIMEOUT_SECONDS,
+            )
+            logger.info("Received response from Gemini")
 
-        # Extract JSON from response
-        response_text = response.text.strip()
-        logger.debug(f"Response text length: {len(response_text)} chars")
+            blocked = _blocked_reason(response)
+            if blocked:
+                raise AIExtractionError(
+                    code=ErrorCode.AI_EXTRACTION_FAILED,
+                    message=f"AI extraction refused: {blocked}",
+                    details={"reason": blocked},
+                )
 
-        if response_text.startswith("{"):
-            extracted_data = json.loads(response_text)
-        else:
-            json_match = re.search(
-                r"```(?:json)?\s*(\{.*?\})\s*```", response_text, re.DOTALL
-            )
-            if json_match:
-                extracted_data = json.loads(json_match.group(1))
-            else:
-                logger.warning("Could not parse JSON from Gemini response")
-                extracted_data = {"rawResponse": response_text}
+            # JSON mode usually returns bare JSON, but fences or prose still
+            # slip through occasionally; parse_json_object tolerates both
+            response_text = response.text or ""
+            logger.debug(f"Response text length: {len(response_text)} chars")
 
+            try:
+                extracted_data = parse_json_object(response_text)
+                break
+            except ValueError as e:
+                if attempt == GEMINI_MAX_RETRIES:
+                    raise
+                logger.warning(
+                    f"Invalid JSON from Gemini (attempt {attempt + 1}), retrying: {e}"
+                )
+                # Show the model its own bad reply so the feedback has context;
+                # an empty reply is just resent, as empty parts are rejected
+                contents = [types.Content(role="user", parts=prompt_parts)]
+                if response_text:
+                    contents += [
+                        types.Content(
+                            role="model",
+                            parts=[types.Part.from_text(text=response_text)],
+                        ),
+                        types.Content(
+                            role="user",
+                            parts=[
+                                types.Part.from_text(
+                                    text=f"Your output had error: {e}. Fix and retry."
+                                )
+                            ],
+                        ),
+                    ]
+                await asyncio.sleep(1 * (attempt + 1))
+
+        await asyncio.to_thread(
+            disk_cache.set,
+            cache_key,
+            extracted_data,
+            LLM_CACHE_DIR,
+            LLM_CACHE_TTL_SECONDS,
+        )
         return extracted_data
 
     except asyncio.TimeoutError:
-        logger.error("Gemini API call timed out after 60 seconds")
+        logger.error(
+            f"Gemini API call timed out after {GEMINI_TIMEOUT_SECONDS} seconds"
+        )
         raise AIExtractionError(
             code=ErrorCode.AI_TIMEOUT,
             message="AI extraction timed out",
-            details={"timeout_seconds": 60},
+            details={"timeout_seconds": GEMINI_TIMEOUT_SECONDS},
         )
+    except AIExtractionError:
+        raise
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse JSON from Gemini response: {e}")
         raise AIExtractionError(
@@ -248,6 +591,19 @@ Now extract the actual field values from this text:
         )
 
 
+def _file_too_large_error(file_size: int, max_size: int) -> ValidationError:
+    """Build the validation error raised for oversized uploads"""
+    return ValidationError(
+        code=ErrorCode.FILE_TOO_LARGE,
+        message=f"File too large. Maximum size is {max_size // (1024*1024)}MB",
+        details={
+            "file_size_bytes": file_size,
+            "max_size_bytes": max_size,
+            "file_size_mb": round(file_size / (1024 * 1024), 2),
+        },
+    )
+
+
 @app.get("/health")
 async def root():
     """Health check endpoint"""
@@ -256,7 +612,8 @@ async def root():
             "status": "ok",
             "service": "PDF OCR and Gemini LLM API",
             "endpoints": {
-                "POST /extract-pdf": "Extract and process PDF with OCR + Gemini"
+                "POST /extract-pdf": "Extract and process PDF with OCR + Gemini",
+                "POST /extract-pdfs": "Extract and process multiple PDFs concurrently",
             },
         }
     except Exception as e:
@@ -264,10 +621,9 @@ async def root():
         return {"status": "error", "error": str(e)}
 
 
-@app.post("/extract-pdf")
-async def extract_pdf(file: UploadFile = File(...)) -> LLMResponse:
-
-    logger.info(f"Calling extract_pdf service for file: {file.filename}")
+async def _process_one(file: UploadFile) -> Dict[str, Any]:
+    """Validate, OCR and extract structured data from a single uploaded PDF"""
+    logger.info(f"Processing uploaded file: {file.filename}")
 
     # Validate file type
     if not file.filename or not file.filename.endswith(".pdf"):
@@ -277,47 +633,55 @@ async def extract_pdf(file: UploadFile = File(...)) -> LLMResponse:
             details={"filename": file.filename, "allowed_types": [".pdf"]},
         )
 
-    # Validate file size
-    content = await file.read()
-    file_size = len(content)
     max_size = 10 * 1024 * 1024  # 10MB
 
-    if file_size > max_size:
-        raise ValidationError(
-            code=ErrorCode.FILE_TOO_LARGE,
-            message=f"File too large. Maximum size is {max_size // (1024*1024)}MB",
-            details={
-                "file_size_bytes": file_size,
-                "max_size_bytes": max_size,
-                "file_size_mb": round(file_size / (1024 * 1024), 2),
-            },
-        )
-
-    logger.info(f"File validated: {file.filename} ({round(file_size / 1024, 2)} KB)")
+    # Reject early when the client declared the size up front
+    if file.size is not None and file.size > max_size:
+        raise _file_too_large_error(file.size, max_size)
 
-    temp_file_path = None
+    fd, temp_file_path = tempfile.mkstemp(suffix=".pdf")
+    os.close(fd)
 
     try:
-        # Save uploaded file to temp location
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+        # Stream the upload to disk in chunks instead of buffering it in memory
+        # Hash while streaming so the OCR cache key costs no extra read
+        file_size = 0
+        digest = hashlib.sha256()
+        async with aiofiles.open(temp_file_path, "wb") as temp_file:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                file_size += len(chunk)
+                if file_size > max_size:
+                    raise _file_too_large_error(file_size, max_size)
+                digest.update(chunk)
+                await temp_file.write(chunk)
 
+        logger.info(
+            f"File validated: {file.filename} ({round(file_size / 1024, 2)} KB)"
+        )
         logger.info(f"Saved uploaded PDF to temporary path: {temp_file_path}")
 
-        # Extract text using OCR
-        extracted_text = extract_text_from_pdf_ocr(temp_file_path)
-        logger.info(f"Extracted text length: {len(extracted_text)} characters")
-        logger.debug(f"Extracted text sample: {extracted_text[:200]}...")
+        # Extract text off the event loop; OCR pages fan out to OCR_POOL
+        loop = asyncio.get_running_loop()
+        pages = await loop.run_in_executor(
+            None, extract_text_from_pdf, temp_file_path, digest.hexdigest()
+        )
+        logger.info(
+            f"Extracted text from {len(pages)} pages: "
+            f"{sum(len(page) for page in pages)} characters"
+        )
+        sample = next((page for page in pages if page), "")
+        logger.debug(f"Extracted text sample: {sample[:200]}...")
 
         # Process with Gemini
-        structured_data = extract_structured_data_with_gemini(extracted_text)
+        structured_data = await extract_structured_data_with_gemini(pages)
         logger.info(
             f"Successfully extracted structured data with {len(structured_data)} top-level fields"
         )
 
-        return LLMResponse(success=True, data=structured_data, error=None)
+        return structured_data
 
+    except ValidationError:
+        raise
     except Exception as e:
         logger.error(
             f"Unexpected error processing PDF: {type(e).__name__}: {e}", exc_info=True
@@ -330,12 +694,68 @@ async def extract_pdf(file: UploadFile = File(...)) -> LLMResponse:
 
     finally:
         # Clean up temp file
-        if temp_file_path:
-            try:
-                os.unlink(temp_file_path)
-                logger.debug(f"Cleaned up temporary file: {temp_file_path}")
-            except Exception as e:
-                logger.warning(f"Failed to clean up temp file {temp_file_path}: {e}")
+        try:
+            os.unlink(temp_file_path)
+            logger.debug(f"Cleaned up temporary file: {temp_file_path}")
+        except Exception as e:
+            logger.warning(f"Failed to clean up temp file {temp_file_path}: {e}")
+
+
+def _error_result(exc: BaseException) -> Dict[str, Any]:
+    """Build the per-file error payload used by the batch endpoint"""
+    if isinstance(exc, PDFProcessingError):
+        error = {"code": exc.code, "message": exc.message, "details": exc.details}
+    else:
+        logger.error(
+            f"Unexpected error in batch item: {type(exc).__name__}: {exc}",
+            exc_info=exc,
+        )
+        error = {
+            "code": ErrorCode.INTERNAL_SERVER_ERROR,
+            "message": "An unexpected error occurred",
+            "details": None,
+        }
+    return {"success": False, "data": {}, "error": error}
+
+
+@app.post("/extract-pdf", response_model=LLMResponse)
+async def extract_pdf(file: UploadFile = File(...)) -> ORJSONResponse:
+
+    logger.info(f"Calling extract_pdf service for file: {file.filename}")
+
+    structured_data = await _process_one(file)
+
+    # Serialize directly with orjson, skipping response_model validation
+    return ORJSONResponse(
+        content={"success": True, "data": structured_data, "error": None}
+    )
+
+
+@app.post("/extract-pdfs", response_model=List[LLMResponse])
+async def extract_pdfs(files: List[UploadFile] = File(...)) -> ORJSONResponse:
+
+    logger.info(f"Calling extract_pdfs service for {len(files)} files")
+
+    if len(files) > MAX_BATCH_FILES:
+        raise ValidationError(
+            code=ErrorCode.VALIDATION_ERROR,
+            message=f"Too many files. Maximum per request is {MAX_BATCH_FILES}",
+            details={"file_count": len(files), "max_files": MAX_BATCH_FILES},
+        )
+
+    # Files are processed concurrently; one failure doesn't fail the batch
+    results = await asyncio.gather(
+        *[_process_one(file) for file in files], return_exceptions=True
+    )
+
+    return ORJSONResponse(
+        content=[
+            _error_result(result)
+            if isinstance(result, BaseException)
+            else {"success": True, "data": result, "error": None}
+            for result in results
+        ]
+    )
 
 
 if __name__ == "__main__":
@@ -344,4 +764,14 @@ if __name__ == "__main__":
     logger.info("API will be available at: http://localhost:8000")
     logger.info("Documentation at: http://localhost:8000/docs")
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Exported so each spawned worker sizes its OCR pool to its share of cores
+    workers = int(os.environ.setdefault("WEB_CONCURRENCY", "2"))
+
+    uvicorn.run(
+        "app.api.gemini_api:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+    )
@@ -0,0 +1,105 @@
+"""
+OCR worker functions executed in the OCR process pool
+
+PDFium is not thread-safe, so every pypdfium2 call lives here and only ever
+runs on the single thread of a pool worker process.
+"""
+
+import math
+import os
+from typing import List, Optional
+
+import cv2
+import numpy as np
+import pypdfium2 as pdfium
+from tesserocr import OEM, PSM, PyTessBaseAPI
+
+# Resolution used to rasterize PDF pages, also reported to Tesseract
+OCR_DPI = int(os.environ.get("OCR_DPI", "200"))
+
+# Cap on rendered pixels per page, so a huge MediaBox cannot exhaust worker
+# memory; oversized pages are rendered below OCR_DPI to fit
+OCR_MAX_PAGE_PIXELS = int(os.environ.get("OCR_MAX_PAGE_PIXELS", "40000000"))
+
+# Binarize pages before OCR so Tesseract skips its own thresholding pass
+OCR_BINARIZE = os.environ.get("OCR_BINARIZE", "1") == "1"
+
+# One Tesseract handle per worker process, so the language model loads only once
+_api: Optional[PyTessBaseAPI] = None
+
+
+def init_worker() -> None:
+    """Initialize the Tesseract API for the current worker process"""
+    global _api
+    _api = PyTessBaseAPI(lang="eng", oem=OEM.LSTM_ONLY, psm=PSM.AUTO)
+    _api.SetVariable("user_defined_dpi", str(OCR_DPI))
+
+
+def count_pages(pdf_path: str) -> int:
+    """Return the number of pages in the PDF"""
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+
+def read_text_layer(pdf_path: str) -> List[str]:
+    """Return the raw embedded text of each PDF page"""
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        pages = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            pages.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+        return pages
+    finally:
+        pdf.close()
+
+
+def binarize(gray: np.ndarray) -> np.ndarray:
+    """Convert a grayscale page to black and white with adaptive thresholding"""
+    return cv2.adaptiveThreshold(
+        gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 10
+    )
+
+
+def render_page(pdf_path: str, page_index: int) -> np.ndarray:
+    """Rasterize one PDF page in-process with PDFium at OCR_DPI as 8-bit grayscale"""
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        page = pdf[page_index]
+        width, height = page.get_size()
+        scale = OCR_DPI / 72
+        area = width * height
+        if area * scale * scale > OCR_MAX_PAGE_PIXELS:
+            scale = math.sqrt(OCR_MAX_PAGE_PIXELS / area)
+        bitmap = page.render(scale=scale, grayscale=True)
+        pixels = bitmap.to_numpy()
+        if pixels.ndim == 3:
+            pixels = pixels[:, :, 0]
+        # to_numpy() is a view of PDFium-owned memory that is freed with the
+        # bitmap, so take an owned, packed copy before closing it
+        gray = np.array(pixels, copy=True, order="C")
+        bitmap.close()
+        page.close()
+        return gray
+    finally:
+        pdf.close()
+
+
+def ocr_page(pdf_path: str, page_index: int) -> str:
+    """Render and run Tesseract OCR on a single PDF page"""
+    if _api is None:
+        init_worker()
+    gray = render_page(pdf_path, page_index)
+    if OCR_BINARIZE:
+        gray = binarize(gray)
+
+    # Hand the raw 8-bit buffer to Tesseract; no PIL image or PNG encode.
+    # tobytes() is the one copy SetImageBytes needs, since it takes bytes
+    height, width = gray.shape
+    _api.SetImageBytes(gray.tobytes(), width, height, 1, width)
+    return _api.GetUTF8Text()